@@ -15,22 +15,19 @@ class TestBlendFileSaveLoadBasic(TestHelper):
 
     def __init__(self, args):
         super().__init__(args)
+        self.ensure_path(args.output_dir)
+        # Take care to keep the name unique so multiple test jobs can run at once.
+        self.output_path = os.path.join(args.output_dir, "blendfile_io.blend")
 
     def test_save_load(self):
         bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
 
         bpy.data.meshes.new("OrphanedMesh")
 
-        output_dir = self.args.output_dir
-        self.ensure_path(output_dir)
-
-        # Take care to keep the name unique so multiple test jobs can run at once.
-        output_path = os.path.join(output_dir, "blendfile_io.blend")
-
         orig_data = self.blender_data_to_tuple(bpy.data, "orig_data 1")
 
-        bpy.ops.wm.save_as_mainfile(filepath=output_path, check_existing=False, compress=False)
-        bpy.ops.wm.open_mainfile(filepath=output_path, load_ui=False)
+        self.save_mainfile(self.output_path)
+        self.open_mainfile(self.output_path)
 
         read_data = self.blender_data_to_tuple(bpy.data, "read_data 1")
 
@@ -41,8 +38,8 @@ class TestBlendFileSaveLoadBasic(TestHelper):
 
         orig_data = self.blender_data_to_tuple(bpy.data, "orig_data 2")
 
-        bpy.ops.wm.save_as_mainfile(filepath=output_path, check_existing=False, compress=False)
-        bpy.ops.wm.open_mainfile(filepath=output_path, load_ui=False)
+        self.save_mainfile(self.output_path)
+        self.open_mainfile(self.output_path)
 
         read_data = self.blender_data_to_tuple(bpy.data, "read_data 2")
 
@@ -57,6 +54,9 @@ class TestBlendFileSavePartial(TestHelper):
 
     def __init__(self, args):
         super().__init__(args)
+        self.ensure_path(args.output_dir)
+        # Take care to keep the name unique so multiple test jobs can run at once.
+        self.output_path = os.path.join(args.output_dir, "blendfile_io_partial.blend")
 
     def test_save_load(self):
         bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
@@ -75,14 +75,8 @@ class TestBlendFileSavePartial(TestHelper):
         self.assertEqual(ob.users, 1)
         self.assertEqual(unused_mesh.users, 0)
 
-        output_dir = self.args.output_dir
-        self.ensure_path(output_dir)
-
-        # Take care to keep the name unique so multiple test jobs can run at once.
-        output_path = os.path.join(output_dir, "blendfile_io_partial.blend")
-
-        bpy.data.libraries.write(filepath=output_path, datablocks={ob, unused_mesh}, fake_user=False)
-        bpy.ops.wm.open_mainfile(filepath=output_path, load_ui=False)
+        bpy.data.libraries.write(filepath=self.output_path, datablocks={ob, unused_mesh}, fake_user=False)
+        self.open_mainfile(self.output_path)
 
         self.assertIn(self.OBJECT_MESH_NAME, bpy.data.meshes)
         self.assertIn(self.OBJECT_MATERIAL_NAME, bpy.data.materials)
@@ -102,31 +96,42 @@ class TestIdRuntimeTag(TestHelper):
 
     def __init__(self, args):
         super().__init__(args)
-
-    def unique_blendfile_name(self, base_name):
-        return base_name + self.__class__.__name__ + ".blend"
+        self.ensure_path(args.output_dir)
+        # Take care to keep the names unique so multiple test jobs can run at once.
+        blendfile_suffix = self.__class__.__name__ + ".blend"
+        self.output_work_path = os.path.join(args.output_dir, "blendfile" + blendfile_suffix)
+        self.output_lib_path = os.path.join(args.output_dir, "blendlib_runtimetag_basic" + blendfile_suffix)
+
+    @staticmethod
+    def gen_default_cube_():
+        # Only the 'Cube' object (and its mesh) is needed from the factory startup data. Creating them in an
+        # empty file keeps all other factory data-blocks out of the depsgraph and the saved/re-loaded files
+        # (the startup data itself is still parsed by `read_homefile`, even with `use_empty`).
+        mesh = bpy.data.meshes.new("Cube")
+        obj = bpy.data.objects.new("Cube", object_data=mesh)
+        bpy.context.collection.objects.link(obj)
+        # Ensure the new object is part of the evaluated depsgraph.
+        bpy.context.view_layer.update()
+        return obj
 
     def test_basics(self):
-        output_dir = self.args.output_dir
-        self.ensure_path(output_dir)
-        bpy.ops.wm.read_homefile(use_empty=False, use_factory_startup=True)
+        bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
+        obj = self.gen_default_cube_()
 
-        obj = bpy.data.objects['Cube']
         self.assertFalse(obj.is_runtime_data)
-        self.assertTrue(bpy.context.view_layer.depsgraph.ids['Cube'].is_runtime_data)
+        self.assertTrue(bpy.context.view_layer.depsgraph.id_eval_get(obj).is_runtime_data)
 
-        output_work_path = os.path.join(output_dir, self.unique_blendfile_name("blendfile"))
-        bpy.ops.wm.save_as_mainfile(filepath=output_work_path, check_existing=False, compress=False)
+        self.save_mainfile(self.output_work_path)
 
-        bpy.ops.wm.open_mainfile(filepath=output_work_path, load_ui=False)
+        self.open_mainfile(self.output_work_path)
         obj = bpy.data.objects['Cube']
         self.assertFalse(obj.is_runtime_data)
 
         obj.is_runtime_data = True
         self.assertTrue(obj.is_runtime_data)
 
-        bpy.ops.wm.save_as_mainfile(filepath=output_work_path, check_existing=False, compress=False)
-        bpy.ops.wm.open_mainfile(filepath=output_work_path, load_ui=False)
+        self.save_mainfile(self.output_work_path)
+        self.open_mainfile(self.output_work_path)
 
         self.assertNotIn('Cube', bpy.data.objects)
         mesh = bpy.data.meshes['Cube']
@@ -134,8 +139,6 @@ class TestIdRuntimeTag(TestHelper):
         self.assertEqual(mesh.users, 0)
 
     def test_linking(self):
-        output_dir = self.args.output_dir
-        self.ensure_path(output_dir)
         bpy.ops.wm.read_homefile(use_empty=False, use_factory_startup=True)
 
         material = bpy.data.materials.new("LibMaterial")
@@ -145,22 +148,21 @@ class TestIdRuntimeTag(TestHelper):
         mesh.materials.append(material)
         mesh.use_fake_user = True
 
-        output_lib_path = os.path.join(output_dir, self.unique_blendfile_name("blendlib_runtimetag_basic"))
-        bpy.ops.wm.save_as_mainfile(filepath=output_lib_path, check_existing=False, compress=False)
+        self.save_mainfile(self.output_lib_path)
 
-        bpy.ops.wm.read_homefile(use_empty=False, use_factory_startup=True)
+        bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
+        obj = self.gen_default_cube_()
 
-        obj = bpy.data.objects['Cube']
         self.assertFalse(obj.is_runtime_data)
         obj.is_runtime_data = True
 
-        link_dir = os.path.join(output_lib_path, "Material")
+        link_dir = os.path.join(self.output_lib_path, "Material")
         bpy.ops.wm.link(directory=link_dir, filename="LibMaterial")
 
         linked_material = bpy.data.materials['LibMaterial']
         self.assertFalse(linked_material.is_library_indirect)
 
-        link_dir = os.path.join(output_lib_path, "Mesh")
+        link_dir = os.path.join(self.output_lib_path, "Mesh")
         bpy.ops.wm.link(directory=link_dir, filename="LibMesh", instance_object_data=False)
 
         linked_mesh = bpy.data.meshes['LibMesh']
@@ -171,8 +173,7 @@ class TestIdRuntimeTag(TestHelper):
         obj.material_slots[0].link = 'OBJECT'
         obj.material_slots[0].material = linked_material
 
-        output_work_path = os.path.join(output_dir, self.unique_blendfile_name("blendfile"))
-        bpy.ops.wm.save_as_mainfile(filepath=output_work_path, check_existing=False, compress=False)
+        self.save_mainfile(self.output_work_path)
 
         # Only usage of this linked material is a runtime ID (object),
         # so writing .blend file will have properly reset its tag to indirectly linked data.
@@ -182,13 +183,15 @@ class TestIdRuntimeTag(TestHelper):
         # so writing .blend file will have properly reset its tag to indirectly linked data.
         self.assertTrue(linked_mesh.is_library_indirect)
 
-        bpy.ops.wm.open_mainfile(filepath=output_work_path, load_ui=False)
+        self.open_mainfile(self.output_work_path)
 
         self.assertNotIn('Cube', bpy.data.objects)
         self.assertNotIn('LibMaterial', bpy.data.materials)
         self.assertNotIn('LibMesh', bpy.data.meshes)
 
 
+# NOTE: Keep in sync with `_blendfile_io_tests` in `tests/python/CMakeLists.txt`, which runs each of these
+#       test classes as its own test instance, classes missing there are not run by CTest.
 TESTS = (
     TestBlendFileSaveLoadBasic,
     TestBlendFileSavePartial,
@@ -210,6 +213,16 @@ def argparse_create():
         help="Where to output temp saved blendfiles",
         required=False,
     )
+    parser.add_argument(
+        "--test",
+        dest="tests",
+        action="append",
+        choices=[Test.__name__ for Test in TESTS],
+        default=None,
+        help="Only run the given test class, can be passed several times (all test classes are run by default). "
+             "Allows to run each test class as its own, parallel, test instance.",
+        required=False,
+    )
 
     return parser
 
@@ -221,9 +234,10 @@ def main():
     bpy.context.preferences.filepaths.file_preview_type = 'NONE'
 
     for Test in TESTS:
+        if args.tests is not None and Test.__name__ not in args.tests:
+            continue
         Test(args).run_all_tests()
 
-
 if __name__ == '__main__':
     import sys
     sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
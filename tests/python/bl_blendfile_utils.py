@@ -22,8 +22,18 @@ class TestHelper(unittest.TestCase):
 
     @classmethod
     def blender_data_to_tuple(cls, bdata, pprint_name=None):
-        ret = sorted(tuple((cls.id_to_uid(k), sorted(tuple(cls.id_to_uid(vv) for vv in v)))
-                           for k, v in bdata.user_map().items()))
+        # Most IDs appear several times in the user map (as key, and as user of other IDs),
+        # only generate their UID once.
+        id_uids = {}
+
+        def id_to_uid_cached(id_data):
+            uid = id_uids.get(id_data)
+            if uid is None:
+                uid = id_uids[id_data] = cls.id_to_uid(id_data)
+            return uid
+
+        ret = sorted((id_to_uid_cached(k), sorted(id_to_uid_cached(vv) for vv in v))
+                     for k, v in bdata.user_map().items())
         if pprint_name is not None:
             print("\n%s:" % pprint_name)
             pprint.pprint(ret)
@@ -34,6 +44,16 @@ class TestHelper(unittest.TestCase):
         if not os.path.exists(path):
             os.makedirs(path)
 
+    @staticmethod
+    def save_mainfile(filepath):
+        # Saved files are only used as test data, skip compression and the existing file check.
+        bpy.ops.wm.save_as_mainfile(filepath=filepath, check_existing=False, compress=False)
+
+    @staticmethod
+    def open_mainfile(filepath):
+        # Keep the current UI, tests only check the loaded data.
+        bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False)
+
     def run_all_tests(self):
         for inst_attr_id in dir(self):
             if not inst_attr_id.startswith("test_"):